@@ -0,0 +1,206 @@
+from discord.ext import commands
+import random
+import asyncio
+
+from helpers import TOO_POOR, get_account, in_casino, load_accounts, save_accounts
+from state import active_blackjack_games
+
+# ───────────────────────
+# Sass libraries
+# ───────────────────────
+INVALID_COLOR = [
+    "That’s not a roulette color.",
+    "Ah yes, the legendary roulette color.",
+    "The wheel disagrees.",
+    "Try red, black, or green.",
+    "Inventing colors won’t help."
+]
+
+BLACKJACK_SASS = [
+    "Bold move. Let’s see how it ends.",
+    "Dealer cracks knuckles.",
+    "Ah, confidence.",
+    "The cards have opinions.",
+    "Time to ruin someone financially."
+]
+
+# ───────────────────────
+# Blackjack utilities
+# ───────────────────────
+SUITS = ["♠️", "♥️", "♦️", "♣️"]
+RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+
+def draw_card():
+    return random.choice(RANKS), random.choice(SUITS)
+
+def hand_value(hand):
+    value = 0
+    aces = 0
+
+    for rank, _ in hand:
+        if rank in ["J", "Q", "K"]:
+            value += 10
+        elif rank == "A":
+            value += 11
+            aces += 1
+        else:
+            value += int(rank)
+
+    while value > 21 and aces:
+        value -= 10
+        aces -= 1
+
+    return value
+
+def render_hand(hand):
+    return " ".join(f"{r}{s}" for r, s in hand)
+
+
+class Casino(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    # ───────────────────────
+    @commands.command()
+    async def roulette(self, ctx, color: str = None, amount: int = 100):
+        if not in_casino(ctx):
+            await ctx.send("🎰 Take it to the casino channel.")
+            return
+
+        if color is None:
+            await ctx.send(random.choice(INVALID_COLOR))
+            return
+
+        color = color.lower()
+        if color not in ["red", "black", "green"]:
+            await ctx.send(random.choice(INVALID_COLOR))
+            return
+
+        accounts = get_account(ctx.author)
+        uid = str(ctx.author.id)
+
+        if amount <= 0:
+            await ctx.send("Nice try.")
+            return
+
+        if accounts[uid]["balance"] < amount:
+            await ctx.send(random.choice(TOO_POOR))
+            return
+        accounts[uid]["balance"] -= amount
+        roll = random.randint(1, 15)
+        ctx.send("And the answer isss.....")
+        asyncio.sleep(2)
+        result = "green" if roll == 15 else "black" if roll % 2 == 0 else "red"
+
+        if color == result:
+            winnings = amount * (14 if color == "green" else 2)
+            accounts[uid]["balance"] += winnings
+            msg = f"🎉 **{result.upper()}!** You won **${winnings}**"
+        else:
+            msg = f"**{result.upper()}**. You lost **${amount}**"
+
+        save_accounts(accounts)
+        await ctx.send(f"{msg}\nBalance: **${accounts[uid]['balance']}**")
+
+    # ───────────────────────
+    @commands.command()
+    async def blackjack(self, ctx, amount: int = 100):
+        if not in_casino(ctx):
+            await ctx.send("🎰 Take it to the casino channel.")
+            return
+
+        uid = str(ctx.author.id)
+
+        if uid in active_blackjack_games:
+            await ctx.send("Finish your current game first.")
+            return
+
+        accounts = get_account(ctx.author)
+
+        if accounts[uid]["balance"] < amount or amount <= 0:
+            await ctx.send(random.choice(TOO_POOR))
+            return
+
+        accounts[uid]["balance"] -= amount
+        save_accounts(accounts)
+
+        player = [draw_card(), draw_card()]
+        dealer = [draw_card(), draw_card()]
+
+        active_blackjack_games[uid] = {
+            "bet": amount,
+            "player": player,
+            "dealer": dealer
+        }
+
+        await ctx.send(
+            f"🃏 **BLACKJACK**\n"
+            f"{random.choice(BLACKJACK_SASS)}\n\n"
+            f"Your hand ({hand_value(player)}): {render_hand(player)}\n"
+            f"Dealer shows: {dealer[0][0]}{dealer[0][1]}\n\n"
+            f"`!hit` or `!stand`"
+        )
+
+    # ───────────────────────
+    @commands.command()
+    async def hit(self, ctx):
+        uid = str(ctx.author.id)
+
+        if uid not in active_blackjack_games:
+            await ctx.send("You’re not playing blackjack.")
+            return
+
+        game = active_blackjack_games[uid]
+        game["player"].append(draw_card())
+        value = hand_value(game["player"])
+
+        if value > 21:
+            del active_blackjack_games[uid]
+            await ctx.send(f"💥 **BUST ({value})**\n{render_hand(game['player'])}")
+            return
+
+        await ctx.send(f"🃏 Hand ({value}): {render_hand(game['player'])}")
+
+    # ───────────────────────
+    @commands.command()
+    async def stand(self, ctx):
+        uid = str(ctx.author.id)
+
+        if uid not in active_blackjack_games:
+            await ctx.send("Standing on nothing.")
+            return
+
+        game = active_blackjack_games[uid]
+        accounts = load_accounts()
+
+        while hand_value(game["dealer"]) < 17:
+            game["dealer"].append(draw_card())
+
+        player_val = hand_value(game["player"])
+        dealer_val = hand_value(game["dealer"])
+        bet = game["bet"]
+
+        payout = 0
+        if dealer_val > 21 or player_val > dealer_val:
+            payout = bet * 2
+            result = "🎉 YOU WIN"
+        elif dealer_val == player_val:
+            payout = bet
+            result = "😐 PUSH"
+        else:
+            result = "💀 DEALER WINS"
+
+        accounts[uid]["balance"] += payout
+        save_accounts(accounts)
+        del active_blackjack_games[uid]
+
+        await ctx.send(
+            f"{result}\n\n"
+            f"Your hand ({player_val}): {render_hand(game['player'])}\n"
+            f"Dealer ({dealer_val}): {render_hand(game['dealer'])}\n\n"
+            f"Balance: **${accounts[uid]['balance']}**"
+        )
+
+
+async def setup(bot):
+    await bot.add_cog(Casino(bot))
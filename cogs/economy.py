@@ -0,0 +1,134 @@
+import discord
+from discord.ext import commands
+import random
+
+from helpers import (
+    ADMIN_ROLE,
+    TOO_POOR,
+    get_account,
+    has_role,
+    in_casino,
+    load_accounts,
+    save_accounts,
+)
+
+
+class Economy(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    # ───────────────────────
+    @commands.command()
+    async def balance(self, ctx):
+        accounts = get_account(ctx.author)
+        bal = accounts[str(ctx.author.id)]["balance"]
+        await ctx.send(f"💰 **{ctx.author.name}**, balance: **${bal}**")
+
+    # ───────────────────────
+    @commands.command()
+    async def work(self, ctx):
+        if not in_casino(ctx):
+            await ctx.send("🎰 Take it to the casino channel.")
+            return
+
+        accounts = get_account(ctx.author)
+        uid = str(ctx.author.id)
+
+        earned = random.randint(50, 100)
+        accounts[uid]["balance"] += earned
+        save_accounts(accounts)
+
+        await ctx.send(f"🛠 You worked and earned **${earned}**.")
+
+    # ───────────────────────
+    @commands.command()
+    async def give(self, ctx, target: discord.Member = None, amount: int = None):
+        if not target or amount is None:
+            await ctx.send("Usage: `!give @user amount`")
+            return
+
+        if target.bot:
+            await ctx.send("Bots do not need money. They need therapy.")
+            return
+
+        if amount <= 0:
+            await ctx.send("Giving negative money is called stealing.")
+            return
+
+        accounts = get_account(ctx.author)
+        uid = str(ctx.author.id)
+        tid = str(target.id)
+
+        if accounts[uid]["balance"] < amount:
+            await ctx.send(random.choice(TOO_POOR))
+            return
+
+        accounts[uid]["balance"] -= amount
+        accounts[tid]["balance"] += amount
+        save_accounts(accounts)
+
+        await ctx.send(
+            f"💸 **TRANSFER COMPLETE**\n"
+            f"{ctx.author.name} → {target.name}\n"
+            f"Amount: **${amount}**"
+        )
+
+    # ───────────────────────
+    @commands.command()
+    async def adminAbuse(self, ctx, target: discord.Member = None, amount: int = None):
+        if not has_role(ctx.author, ADMIN_ROLE):
+            await ctx.send("No")
+            return
+
+        if not target or amount is None:
+            await ctx.send("Usage: `!adminAbuse @user amount`")
+            return
+
+        if target.bot:
+            await ctx.send("Bots do not need money. They need therapy.")
+            return
+
+        accounts = load_accounts()
+        uid = str(ctx.author.id)
+        tid = str(target.id)
+
+        if uid not in accounts:
+            accounts[uid] = {"name": ctx.author.name, "balance": 1000}
+
+        if tid not in accounts:
+            accounts[tid] = {"name": target.name, "balance": 1000}
+
+        accounts[tid]["balance"] += amount
+        save_accounts(accounts)
+
+        await ctx.send(
+            f"💸 **ADMIN ABUSE SUCCESSFUL**\n"
+            f"{ctx.author.name} blessed {target.name}\n"
+            f"Amount: **${amount}**"
+        )
+
+    # ───────────────────────
+    @commands.command()
+    async def pickpocket(self, ctx, target: discord.Member):
+        if target == ctx.author:
+            await ctx.send("Stealing from yourself is a cry for help.")
+            return
+
+        accounts = load_accounts()
+
+        uid = str(ctx.author.id)
+        tid = str(target.id)
+
+        if random.random() < 0.3 and accounts[tid]["balance"] >= 100:
+            stolen = random.randint(100, 200)
+            accounts[tid]["balance"] -= stolen
+            accounts[uid]["balance"] += stolen
+            msg = f"You stole **${stolen}** from {target.name}."
+        else:
+            msg = "You got caught. Everyone judges you."
+
+        await ctx.send(msg)
+
+
+async def setup(bot):
+    await bot.add_cog(Economy(bot))
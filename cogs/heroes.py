@@ -0,0 +1,27 @@
+from discord.ext import commands
+import random
+
+OVERWATCH = {
+    "tank": ["Reinhardt", "D.Va", "WINTON", "Sigma", "Orisa", "Zarya", "Wrecking Ball..... or whoever you reroll next", "Roadhog", "Mauga", "Junker Queen", "Hazard", "Doomfist"],
+    "damage": ["Vendetta", "Ashe", "Bastion", "Cassidy", "Echo", "The awesome Genji", "Freja", "Hanzo", "Junkrat", "Sata- I mean Mei", "Pharah in the sky", "Reaper", "Sojourn", "Soldier", "...Sombra", "Symmetra", "TORB TIMEEE", "Tracer", "Venture", "Widowmaker"],
+    "support": ["Ana", "Mercy", "Kiriko", "Lucio", "Baptiste", "Brigitte", "Illiari", "Juno", "Wife Leaver", "Lucio", "Moira", "Zenyatta"],
+}
+
+
+class Heroes(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command()
+    async def pickHero(self, ctx, role: str = None):
+        role = role.lower() if role else None
+        if role and role not in OVERWATCH:
+            await ctx.send("Tank, Damage, or Support. Choose wisely.")
+            return
+
+        heroes = OVERWATCH[role] if role else sum(OVERWATCH.values(), [])
+        await ctx.send(f"**{random.choice(heroes)}**")
+
+
+async def setup(bot):
+    await bot.add_cog(Heroes(bot))
@@ -0,0 +1,50 @@
+import discord
+from discord.ext import commands
+
+from helpers import CASINO_CHANNEL_NAME, GENERAL_CHANNEL_NAME, GUILD_ID
+
+
+class Relay(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    # ─── DM Relay System ───
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        if message.author.bot:
+            return
+
+        if not isinstance(message.channel, discord.DMChannel):
+            return
+
+        for guild in self.bot.guilds:
+            if GUILD_ID and guild.id != GUILD_ID:
+                continue
+
+            channel1 = discord.utils.get(guild.text_channels, name=CASINO_CHANNEL_NAME)
+            channel2 = discord.utils.get(guild.text_channels, name=GENERAL_CHANNEL_NAME)
+            if not channel2:
+                channel2 = channel1
+
+            content = message.content if message.content else "*[No text]*"
+
+            if content.startswith("[1]"):
+                output = content[3:]
+                channel = channel2
+            elif content.startswith("[2]"):
+                output = content[3:]
+                channel = channel1
+            else:
+                channel = channel1
+                output = content
+
+            if channel:
+                await channel.send(output)
+
+                for attachment in message.attachments:
+                    await channel.send(attachment.url)
+                break
+
+
+async def setup(bot):
+    await bot.add_cog(Relay(bot))
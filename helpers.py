@@ -0,0 +1,67 @@
+import os
+import json
+
+# ───────────────────────
+# Config
+# ───────────────────────
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_FILE = os.path.join(BASE_DIR, "accounts.json")
+GENERAL_CHANNEL_NAME = "general"
+GUILD_ID = None
+CASINO_CHANNEL_NAME = "casino"
+ADMIN_ROLE = "GenkiJi"
+
+# ───────────────────────
+# Sass libraries
+# ───────────────────────
+TOO_POOR = [
+    "You’re broke. Emotionally and financially.",
+    "That wallet is looking *real* empty.",
+    "Nice try, Rockefeller.",
+    "You can’t bet what you don’t have.",
+    "Even the dealer feels bad for you.",
+    "This casino does not accept vibes.",
+    "Your balance said no.",
+    "Try again after capitalism helps you.",
+    "Money required. You lack it.",
+    "Come back when you have funds."
+]
+
+# ───────────────────────
+# Helpers
+# ───────────────────────
+def in_casino(ctx):
+    return ctx.channel.name == CASINO_CHANNEL_NAME or ctx.author.guild_permissions.administrator
+
+def has_role(member, role_name):
+    return any(role.name == role_name for role in member.roles)
+
+def load_accounts():
+    try:
+        if not os.path.exists(DATA_FILE):
+            with open(DATA_FILE, "w") as f:
+                json.dump({}, f)
+            return {}
+        with open(DATA_FILE, "r") as f:
+            return json.load(f)
+    except Exception as e:
+        print("ACCOUNT LOAD ERROR:", e)
+        return {}
+
+
+def save_accounts(data):
+    with open(DATA_FILE, "w") as f:
+        json.dump(data, f, indent=4)
+
+def get_account(user):
+    accounts = load_accounts()
+    uid = str(user.id)
+
+    if uid not in accounts:
+        accounts[uid] = {
+            "name": user.name,
+            "balance": 1000
+        }
+        save_accounts(accounts)
+
+    return accounts
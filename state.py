@@ -0,0 +1,8 @@
+# ───────────────────────
+# Long-lived state
+# ───────────────────────
+# Cogs are reloaded live with `!reload`, which re-imports their modules and
+# would wipe anything defined in them. Keep state that has to outlive a
+# reload here instead. This module is never reloaded.
+
+active_blackjack_games = {}